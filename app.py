@@ -1,5 +1,6 @@
 
 import React, { useState } from 'react';
+import Papa from 'papaparse';
 import { CertificateUpload } from '../components/CertificateUpload';
 import { VerificationResult } from '../components/VerificationResult';
 import { VerificationResult as VerificationResultType, CertificateData } from '../types';
@@ -9,7 +10,7 @@ export const VerifyPage = () => {
   const [isLoading, setIsLoading] = useState(false);
 
   // Dataset that we can allow uploading or pre-fill with CSV
-  const [dataset, setDataset] = useState<CertificateData[]>([]);
+  const [dataset, setDataset] = useState<Map<string, CertificateData>>(new Map());
 
   const handleVerification = async (file: File) => {
     setIsLoading(true);
@@ -26,7 +27,7 @@ export const VerifyPage = () => {
     };
 
     // Check dataset for match
-    const match = dataset.find(d => d.certificateId === extractedData.certificateId);
+    const match = dataset.get(extractedData.certificateId!);
 
     const result: VerificationResultType = match
       ? {
@@ -44,32 +45,48 @@ export const VerifyPage = () => {
           timestamp: new Date().toISOString()
         };
 
-    setTimeout(() => {
-      setVerificationResult(result);
-      setIsLoading(false);
-    }, 1500);
+    setVerificationResult(result);
+    setIsLoading(false);
   };
 
   const handleDatasetUpload = (file: File) => {
-    const reader = new FileReader();
-    reader.onload = (e) => {
-      try {
-        const text = e.target?.result as string;
-        const rows = text.split('\n').filter(Boolean);
-        const headers = rows[0].split(',');
-        const data: CertificateData[] = rows.slice(1).map(row => {
-          const values = row.split(',');
-          const obj: any = {};
-          headers.forEach((h, i) => obj[h.trim()] = values[i]?.trim() || '');
-          return obj as CertificateData;
-        });
-        setDataset(data);
+    const data: CertificateData[] = [];
+    let failed = false;
+    Papa.parse<Record<string, unknown>>(file, {
+      header: true,
+      worker: true,
+      skipEmptyLines: true,
+      step: ({ data: row, errors, meta }, parser) => {
+        if (failed) return;
+        try {
+          // Rows with too many or too few fields were accepted before; broken quoting is not
+          const parseError = errors.find(err => err.type !== 'FieldMismatch');
+          if (parseError) throw new Error(parseError.message);
+          const obj: any = { name: '', rollNumber: '', certificateId: '', institution: '', issueDate: '', course: '', grades: '' };
+          // Only header fields: extra values land in __parsed_extra as an array and are ignored
+          (meta.fields ?? []).forEach(h => {
+            const v = row[h];
+            obj[h.trim()] = typeof v === 'string' ? v.trim() : '';
+          });
+          data.push(obj as CertificateData);
+        } catch (err) {
+          failed = true;
+          parser.abort();
+          alert('Failed to load dataset!');
+        }
+      },
+      complete: () => {
+        if (failed) return;
+        // First row wins for duplicate IDs, as Array.find did
+        const index = new Map<string, CertificateData>();
+        for (const d of data) if (!index.has(d.certificateId)) index.set(d.certificateId, d);
+        setDataset(index);
         alert('Dataset loaded successfully!');
-      } catch (err) {
+      },
+      error: () => {
         alert('Failed to load dataset!');
       }
-    };
-    reader.readAsText(file);
+    });
   };
 
   return (
@@ -1,6 +1,56 @@
 import streamlit as st
 import pandas as pd
-from datetime import datetime
+from datetime import date
+from types import MappingProxyType
+from blake3 import blake3
+
+# -----------------------
+# Helpers
+# -----------------------
+_TODAY = date.today().isoformat()
+_UNKNOWN_TEMPLATE = MappingProxyType({
+    "name": "Unknown",
+    "rollNumber": "Unknown",
+    "certificateId": "Unknown",
+    "institution": "Unknown",
+    "course": "Unknown",
+    "grades": "Unknown",
+    "issueDate": _TODAY
+})
+
+def _digest_upload(f) -> bytes:
+    # Hash in 1 MiB chunks so the cache key never needs a second copy of the file
+    h = blake3()
+    f.seek(0)
+    for chunk in iter(lambda: f.read(1 << 20), b''):
+        h.update(chunk)
+    f.seek(0)
+    return h.digest()
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _load_csv(digest: bytes, _file) -> pd.DataFrame:
+    # Read every column as text: inference turns dates into datetime.date
+    # (which st.json can only repr) and strips leading zeros from IDs
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pv
+    except ImportError:
+        return pd.read_csv(_file, engine="c", dtype="string", low_memory=False)
+    else:
+        names = pv.open_csv(_file).schema.names
+        _file.seek(0)
+        table = pv.read_csv(_file, convert_options=pv.ConvertOptions(
+            column_types=dict.fromkeys(names, pa.string()),
+            strings_can_be_null=True,
+        ))
+        return table.to_pandas(types_mapper={pa.string(): pd.StringDtype("pyarrow")}.get)
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _build_index(digest: bytes, _df: pd.DataFrame) -> pd.DataFrame:
+    # Keyed on the upload digest; hashing the frame itself costs more than a scan.
+    # First row wins for duplicate IDs, matching the old boolean-mask lookup
+    indexed = _df.set_index("certificateId", drop=False)
+    return indexed[~indexed.index.duplicated()]
 
 # -----------------------
 # Title
@@ -15,7 +65,11 @@ dataset_file = st.file_uploader("Upload CSV dataset", type=["csv"])
 df = pd.DataFrame()
 if dataset_file:
     try:
-        df = pd.read_csv(dataset_file)
+        digest = _digest_upload(dataset_file)
+        if st.session_state.get("dataset_digest") != digest:
+            st.session_state["dataset_df"] = _load_csv(digest, dataset_file)
+            st.session_state["dataset_digest"] = digest
+        df = st.session_state["dataset_df"]
         st.success("Dataset loaded successfully!")
         st.info("CSV columns: name, rollNumber, certificateId, institution, issueDate, course, grades")
     except Exception as e:
@@ -34,25 +88,18 @@ if cert_file and not df.empty:
     st.info("Processing certificate...")
 
     # Simulated OCR: for testing, ask user to input certificate ID
-    extracted_cert_id = st.text_input("Enter certificate ID (simulate OCR extraction)")
+    with st.form("verify"):
+        extracted_cert_id = st.text_input("Enter certificate ID (simulate OCR extraction)")
+        verify_clicked = st.form_submit_button("Verify")
 
-    if extracted_cert_id:
+    if verify_clicked and extracted_cert_id:
         # Check dataset
-        match = df[df['certificateId'].astype(str) == str(extracted_cert_id)]
-        if not match.empty:
+        indexed = _build_index(digest, df)
+        if extracted_cert_id in indexed.index:
             st.success("Certificate is Authentic ✅")
-            record = match.to_dict(orient="records")[0]
-            st.json(record)
+            st.json(indexed.loc[extracted_cert_id].to_dict())
         else:
             st.warning("Data Not Available ❌")
-            st.json({
-                "name": "Unknown",
-                "rollNumber": "Unknown",
-                "certificateId": extracted_cert_id,
-                "institution": "Unknown",
-                "course": "Unknown",
-                "grades": "Unknown",
-                "issueDate": datetime.now().strftime("%Y-%m-%d")
-            })
+            st.json({**_UNKNOWN_TEMPLATE, "certificateId": extracted_cert_id})
 elif cert_file and df.empty:
     st.warning("Please upload a dataset first!")